@@ -20,18 +20,46 @@ import os
 import re
 import sys
 import zipfile
-import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# ---------- Optional faster XML parser (same API as ElementTree) ----------
+try:
+    from lxml import etree as ET
+    LXML_OK = True
+except Exception:
+    import xml.etree.ElementTree as ET
+    LXML_OK = False
+
+# lxml can drop whitespace-only text, comments and PIs while parsing, so they never become nodes
+ITERPARSE_OPTS = {"remove_blank_text": True, "remove_comments": True, "remove_pis": True} if LXML_OK else {}
 
 # ---------- Optional Excel support ----------
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.utils import get_column_letter
     OPENPYXL_OK = True
 except Exception:
     OPENPYXL_OK = False
 
+# xlsxwriter is preferred when present: it streams rows without building cell objects
+try:
+    import xlsxwriter
+    XLSXWRITER_OK = True
+except Exception:
+    XLSXWRITER_OK = False
+
+# orjson is a faster drop-in for json.loads when installed
+try:
+    import orjson
+    json_loads = orjson.loads
+except Exception:
+    json_loads = json.loads
+
 # ---------- Column definitions ----------
 ANIMAL_COLUMNS = [
     "placeable_id",
@@ -151,6 +179,8 @@ SUMMARY_FLOAT_COLS = {
 }
 SUMMARY_DATE_COLS = set()
 
+# IDs, codes, genetics tiers and due dates repeat across a herd, so casts are memoized
+@lru_cache(maxsize=4096)
 def _to_int_or_none(v: str):
     if v is None or v == "": return None
     try:
@@ -159,6 +189,7 @@ def _to_int_or_none(v: str):
     except Exception:
         return None
 
+@lru_cache(maxsize=4096)
 def _to_float_or_none(v: str):
     if v is None or v == "": return None
     try:
@@ -166,6 +197,7 @@ def _to_float_or_none(v: str):
     except Exception:
         return None
 
+@lru_cache(maxsize=4096)
 def _excel_date_or_text(v: str):
     """Return a real date object for Excel if year >= 1900; else return the original text or None."""
     if v is None or v == "": return None
@@ -178,43 +210,51 @@ def _excel_date_or_text(v: str):
     except Exception:
         return v              # not a valid ISO date -> keep as TEXT
 
-def _cast_for_sheet(row: dict, columns: list, int_cols: set, float_cols: set, date_cols: set):
-    out = []
+def _text_or_none(v: Optional[str]):
+    return v if v != "" else None
+
+def _build_schema(columns: list, int_cols: set, float_cols: set, date_cols: set):
+    """Resolve each column's caster once per sheet: [(col, caster), ...] in column order."""
+    schema = []
     for col in columns:
-        val = row.get(col, "")
         if col in date_cols:
-            out.append(_excel_date_or_text(val))
+            schema.append((col, _excel_date_or_text))
         elif col in int_cols:
-            out.append(_to_int_or_none(val))
+            schema.append((col, _to_int_or_none))
         elif col in float_cols:
-            out.append(_to_float_or_none(val))
+            schema.append((col, _to_float_or_none))
         else:
-            out.append(val if val != "" else None)
-    return out
+            schema.append((col, _text_or_none))
+    return schema
+
+def _cast_row(row: dict, schema: list):
+    return [cast(row.get(col)) for col, cast in schema]
 
 # ---------- Tiny XML helpers ----------
 def _basename_or(val: str, fallback: str = "") -> str:
-    try: return os.path.basename(val) if val else fallback
-    except Exception: return fallback
+    return os.path.basename(val) if val else fallback
 
 def _text(elem: Optional[ET.Element]) -> str:
     return (elem.text or "").strip() if elem is not None and elem.text else ""
 
-def _get_attr(elem: Optional[ET.Element], name: str, default: str = "") -> str:
-    return elem.get(name, default) if elem is not None else default
-
 def _child(elem: Optional[ET.Element], name: str) -> Optional[ET.Element]:
     return elem.find(name) if elem is not None else None
 
-def _genetics(elem: Optional[ET.Element]) -> Dict[str, str]:
-    g = _child(elem, "genetics")
-    return {
-        "metabolism": _get_attr(g, "metabolism"),
-        "quality": _get_attr(g, "quality"),
-        "health": _get_attr(g, "health"),
-        "fertility": _get_attr(g, "fertility"),
-        "productivity": _get_attr(g, "productivity"),
-    }
+GENETICS_KEYS = ("metabolism", "quality", "health", "fertility", "productivity")
+_GENETICS_GET = itemgetter(*GENETICS_KEYS)
+_NO_GENETICS = ("",) * len(GENETICS_KEYS)
+
+def _genetics(elem: Optional[ET.Element]) -> Tuple[str, ...]:
+    return _genetics_attrs(_child(elem, "genetics"))
+
+def _genetics_attrs(g: Optional[ET.Element]) -> Tuple[str, ...]:
+    """(metabolism, quality, health, fertility, productivity) of a <genetics> node; "" when missing."""
+    if g is None: return _NO_GENETICS
+    attrib = g.attrib
+    try:
+        return _GENETICS_GET(attrib)  # one C call for the usual all-present case
+    except KeyError:
+        return tuple(attrib.get(k, "") for k in GENETICS_KEYS)
 
 # ---------- Species detection & normalization ----------
 SPECIES_KEYS = {
@@ -226,19 +266,32 @@ SPECIES_KEYS = {
     "horse": "horses", "equine": "horses",
 }
 
-def infer_species(placeable: ET.Element, shed_file: str, animal: ET.Element) -> str:
-    t = _get_attr(animal, "type") or _get_attr(animal, "animalType")
+# All keywords in one alternation, so each string is scanned once in C. The lookahead reports
+# a keyword at every position (overlaps included) and the earliest SPECIES_KEYS entry found
+# wins -- not the leftmost one in the text ("kitchencowbarn" is cows, not "hen").
+_SPECIES_RANK = {k: i for i, k in enumerate(SPECIES_KEYS)}
+_SPECIES_BY_RANK = list(SPECIES_KEYS.values())
+_SPECIES_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in SPECIES_KEYS) + "))")
+
+def _species_in(text: str) -> str:
+    rank = min((_SPECIES_RANK[m.group(1)] for m in _SPECIES_RE.finditer(text)), default=None)
+    return _SPECIES_BY_RANK[rank] if rank is not None else ""
+
+def placeable_species(placeable: ET.Element, shed_file: str) -> str:
+    """Species implied by the shed itself (<type>, then filename); shared by all its animals."""
+    v = _species_in(_text(_child(placeable, "type")).lower())
+    if v: return v
+    return _species_in((shed_file or "").lower())
+
+def infer_species(placeable: ET.Element, shed_file: str, animal: ET.Element,
+                  shed_species: Optional[str] = None) -> str:
+    t = animal.get("type") or animal.get("animalType")
     if t:
-        tl = t.lower()
-        for k, v in SPECIES_KEYS.items():
-            if k in tl: return v
-    pt = _text(_child(placeable, "type")).lower()
-    for k, v in SPECIES_KEYS.items():
-        if k and k in pt: return v
-    lf = (shed_file or "").lower()
-    for k, v in SPECIES_KEYS.items():
-        if k and k in lf: return v
-    return ""
+        v = _species_in(t.lower())
+        if v: return v
+    if shed_species is None:
+        shed_species = placeable_species(placeable, shed_file)
+    return shed_species
 
 def normalize_species_list(s: str) -> List[str]:
     out = []
@@ -253,8 +306,28 @@ def normalize_species_list(s: str) -> List[str]:
     return res
 
 # ---------- Country mapping (Realistic Livestock) ----------
+_TRUE = frozenset(("1", "true", "yes", "on"))
+
 def _str_to_bool(s: str) -> bool:
-    return str(s).strip().lower() in ("1", "true", "yes", "on")
+    return s.strip().lower() in _TRUE if isinstance(s, str) else False
+
+def _find_mods_override(settings_path: str) -> Optional[ET.Element]:
+    """Stream gameSettings.xml and stop at its top-level <modsDirectoryOverride> (exact case preferred)."""
+    node = None
+    depth = 0
+    with open(settings_path, "rb") as fh:
+        for event, elem in ET.iterparse(fh, events=("start", "end"), **ITERPARSE_OPTS):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if elem.tag == "modsDirectoryOverride":
+                return elem
+            if node is None and elem.tag.lower() == "modsdirectoryoverride":
+                node = elem
+    return node
 
 def find_mods_dir(fs_root: str, verbose: bool = False) -> str:
     settings_path = os.path.join(fs_root, "gameSettings.xml")
@@ -263,15 +336,10 @@ def find_mods_dir(fs_root: str, verbose: bool = False) -> str:
         if verbose: print(f"[info] gameSettings.xml not found; using default mods dir: {default_dir}")
         return default_dir
     try:
-        root = ET.parse(settings_path).getroot()
+        node = _find_mods_override(settings_path)
     except Exception as e:
         if verbose: print(f"[warn] could not parse gameSettings.xml: {e}")
         return default_dir
-    node = root.find("modsDirectoryOverride")
-    if node is None:
-        for child in root:
-            if child.tag.lower() == "modsdirectoryoverride":
-                node = child; break
     if node is None:
         if verbose: print(f"[info] modsDirectoryOverride not present; using default mods dir: {default_dir}")
         return default_dir
@@ -291,92 +359,214 @@ def _looks_like_rl_mod(name: str) -> bool:
     n = name.lower()
     return ("realistic" in n and "livestock" in n) or n.startswith("fs25_realisticlivestock")
 
+_RE_BRACE = re.compile(r'[{}]')
+
 def _brace_body(text: str, header: str) -> Optional[str]:
     i = text.find(header)
     if i < 0: return None
     j = text.find("{", i)
     if j < 0: return None
     depth = 0
-    for k in range(j, len(text)):
-        c = text[k]
-        if c == "{": depth += 1
-        elif c == "}":
+    for m in _RE_BRACE.finditer(text, j):  # visit brace positions only, not every char
+        if m.group() == "{": depth += 1
+        else:
             depth -= 1
             if depth == 0:
-                return text[j+1:k]
+                return text[j+1:m.start()]
     return None
 
+# One scan for the usual `[n] = { ["code"] = "..", ["country"] = ".." }` shape (groups 2, 3);
+# any other entry falls through to the lazy body match (group 4) and the per-field searches.
+_RE_AREA_ENTRY = re.compile(
+    r'\[\s*(\d+)\s*\]\s*=\s*{'
+    r'(?:\s*\["code"\]\s*=\s*"([^"]*)"\s*,\s*\["country"\]\s*=\s*"([^"]*)"\s*,?\s*}|(.*?)})', re.S)
+_RE_AREA_CODE  = re.compile(r'\["code"\]\s*=\s*"([^"]*)"')
+_RE_AREA_NAME  = re.compile(r'\["country"\]\s*=\s*"([^"]*)"')
+
 def _parse_area_codes_from_lua(lua_text: str) -> Tuple[Dict[str,str], Dict[str,str]]:
     body = _brace_body(lua_text, "AREA_CODES")
     if not body: return {}, {}
     name_map, iso_map = {}, {}
-    for entry in re.finditer(r'\[\s*(\d+)\s*\]\s*=\s*{(.*?)}', body, flags=re.S):
-        idx = entry.group(1); sub = entry.group(2)
-        m_code = re.search(r'\["code"\]\s*=\s*"([^"]*)"', sub)
-        m_name = re.search(r'\["country"\]\s*=\s*"([^"]*)"', sub)
+    for entry in _RE_AREA_ENTRY.finditer(body):
+        idx, code, name, sub = entry.groups()
+        if sub is None:
+            name_map[idx] = name; iso_map[idx] = code
+            continue
+        m_code = _RE_AREA_CODE.search(sub)
+        m_name = _RE_AREA_NAME.search(sub)
         if m_name: name_map[idx] = m_name.group(1)
         if m_code: iso_map[idx]  = m_code.group(1)
     return name_map, iso_map
 
+def _is_rl_lua_member(name: str) -> bool:
+    n = name.lower()
+    return n == "realisticlivestock.lua" or n.endswith("/realisticlivestock.lua")
+
+# Where the RL mod ships its lua; tried by exact name before scanning the whole archive
+RL_LUA_MEMBERS = ("src/RealisticLivestock.lua", "RealisticLivestock.lua")
+
+def _rl_lua_info(zf: zipfile.ZipFile) -> Optional[zipfile.ZipInfo]:
+    for name in RL_LUA_MEMBERS:
+        try:
+            return zf.getinfo(name)
+        except KeyError:
+            pass
+    for info in zf.infolist():
+        if _is_rl_lua_member(info.filename):
+            return info
+    return None
+
+LUA_CHUNK_SIZE = 1 << 16
+_RE_BRACE_B = re.compile(rb'[{}]')
+
+def _read_area_codes_block(stream, header: bytes = b"AREA_CODES") -> str:
+    """Read a binary lua stream only as far as the end of its AREA_CODES table and decode just that
+    block ("" if absent or unbalanced); the rest of the file is never read or decoded."""
+    buf = bytearray()
+    found = False
+    pos = depth = 0
+    while True:
+        chunk = stream.read(LUA_CHUNK_SIZE)
+        if not chunk: return ""
+        buf += chunk
+        if not found:
+            i = buf.find(header)
+            if i < 0:
+                del buf[:-(len(header) - 1)]  # keep a header split across chunks
+                continue
+            del buf[:i]
+            found = True; pos = len(header)
+        for m in _RE_BRACE_B.finditer(buf, pos):
+            if m.group() == b"{": depth += 1
+            elif depth:  # a "}" before the table's opening brace is not part of it
+                depth -= 1
+                if depth == 0:
+                    return buf[:m.end()].decode("utf-8", errors="ignore")
+        pos = len(buf)
+
+def _scan_zip_for_rl_lua(path: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
+    """Open a mod zip once, read its central directory once, parse the first RL lua found."""
+    try:
+        with zipfile.ZipFile(path, "r") as zf:
+            info = _rl_lua_info(zf)
+            if info is not None:
+                if verbose: print(f"[info] reading RL lua from zip: {path} -> {info.filename}")
+                with zf.open(info) as raw:
+                    return _parse_area_codes_from_lua(_read_area_codes_block(raw))
+    except Exception as e:
+        if verbose: print(f"[warn] failed to inspect zip {path}: {e}")
+    return {}, {}
+
+def _read_rl_lua_file(lua_path: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
+    if verbose: print(f"[info] reading RL lua: {lua_path}")
+    try:
+        with open(lua_path, "rb") as fh:
+            return _parse_area_codes_from_lua(_read_area_codes_block(fh))
+    except Exception as e:
+        if verbose: print(f"[warn] failed to read RL lua: {e}")
+    return {}, {}
+
+# Parsed AREA_CODES of the last RL source seen, keyed by (abs path, mtime, size).
+AREA_CODES_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "fs25_export", "area_codes.json")
+_area_codes_cache = None
+
+def _cached_area_codes(src_path: str, load, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
+    """Return load() for src_path, reusing the on-disk cache while the file is unchanged."""
+    global _area_codes_cache
+    try:
+        st = os.stat(src_path)
+        key = [os.path.abspath(src_path), st.st_mtime, st.st_size]
+    except OSError:
+        return load()
+    if _area_codes_cache is None:
+        try:
+            with open(AREA_CODES_CACHE, "rb") as fh:
+                _area_codes_cache = json_loads(fh.read())
+        except Exception:
+            _area_codes_cache = {}
+    if isinstance(_area_codes_cache, dict) and _area_codes_cache.get("key") == key:
+        if verbose: print(f"[info] using cached RL country map for: {src_path}")
+        return dict(_area_codes_cache.get("names") or {}), dict(_area_codes_cache.get("isos") or {})
+    names, isos = load()
+    if names:
+        _area_codes_cache = {"key": key, "names": names, "isos": isos}
+        try:
+            ensure_dir_for(AREA_CODES_CACHE)
+            tmp = f"{AREA_CODES_CACHE}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump(_area_codes_cache, fh)
+            os.replace(tmp, AREA_CODES_CACHE)
+        except OSError as e:
+            if verbose: print(f"[warn] could not write RL country map cache: {e}")
+    return names, isos
+
+RL_LUA_MAX_DEPTH = 3  # the lua sits in src/ of an unpacked mod; don't crawl its whole asset tree
+
+def _iter_rl_lua_files(path: str):
+    """RealisticLivestock.lua candidates under an unpacked mod: known locations first, then a
+    breadth-first scandir search at most RL_LUA_MAX_DEPTH folders deep."""
+    known = [p for p in (os.path.join(path, *m.split("/")) for m in RL_LUA_MEMBERS) if os.path.isfile(p)]
+    yield from known
+    level = [path]
+    for _depth in range(RL_LUA_MAX_DEPTH + 1):
+        subdirs = []
+        for d in level:
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.is_dir():
+                            subdirs.append(e.path)
+                        elif e.name.lower() == "realisticlivestock.lua" and e.is_file() and e.path not in known:
+                            yield e.path
+            except OSError:
+                continue
+        level = subdirs
+
+def _load_area_codes_from_rl_dir(path: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
+    for lua_path in _iter_rl_lua_files(path):
+        names, isos = _cached_area_codes(lua_path, lambda: _read_rl_lua_file(lua_path, verbose), verbose)
+        if names:
+            return names, isos
+    return {}, {}
+
+def _load_area_codes_from_rl_zip(path: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
+    return _cached_area_codes(path, lambda: _scan_zip_for_rl_lua(path, verbose=verbose), verbose)
+
 def _load_area_codes_from_rl_path(path: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str]]:
     if os.path.isdir(path):
-        for root, _dirs, files in os.walk(path):
-            for fn in files:
-                if fn.lower() == "realisticlivestock.lua":
-                    lua_path = os.path.join(root, fn)
-                    if verbose: print(f"[info] reading RL lua: {lua_path}")
-                    try:
-                        with open(lua_path, "r", encoding="utf-8", errors="ignore") as fh:
-                            txt = fh.read()
-                        return _parse_area_codes_from_lua(txt)
-                    except Exception as e:
-                        if verbose: print(f"[warn] failed to read RL lua: {e}")
-    elif os.path.isfile(path) and path.lower().endswith(".zip"):
-        try:
-            with zipfile.ZipFile(path, "r") as zf:
-                cands = [n for n in zf.namelist() if n.lower().endswith("/realisticlivestock.lua") or n.lower()=="realisticlivestock.lua"]
-                for n in cands:
-                    if verbose: print(f"[info] reading RL lua from zip: {path} -> {n}")
-                    txt = zf.read(n).decode("utf-8", errors="ignore")
-                    return _parse_area_codes_from_lua(txt)
-        except Exception as e:
-            if verbose: print(f"[warn] failed to inspect zip {path}: {e}")
+        return _load_area_codes_from_rl_dir(path, verbose=verbose)
+    if os.path.isfile(path) and path.lower().endswith(".zip"):
+        return _load_area_codes_from_rl_zip(path, verbose=verbose)
     return {}, {}
 
 def load_area_codes_from_rl(mods_dir: str, verbose: bool=False) -> Tuple[Dict[str,str], Dict[str,str], List[str]]:
     checked = []
     if not os.path.isdir(mods_dir):
         return {}, {}, checked
-    entries = os.listdir(mods_dir)
-    rl_candidates = [e for e in entries if _looks_like_rl_mod(e)]
-    scan_order = rl_candidates + [e for e in entries if e not in rl_candidates]
+    # scandir's DirEntry caches the file type, so no extra stat per mod
+    with os.scandir(mods_dir) as it:
+        entries = list(it)
+    rl_candidates = [e for e in entries if _looks_like_rl_mod(e.name)]
+    scan_order = rl_candidates + [e for e in entries if not _looks_like_rl_mod(e.name)]
     for entry in scan_order:
-        p = os.path.join(mods_dir, entry)
-        checked.append(p)
-        names, isos = _load_area_codes_from_rl_path(p, verbose=verbose)
+        checked.append(entry.path)
+        if entry.is_dir():
+            names, isos = _load_area_codes_from_rl_dir(entry.path, verbose=verbose)
+        elif entry.is_file() and entry.name.lower().endswith(".zip"):
+            names, isos = _load_area_codes_from_rl_zip(entry.path, verbose=verbose)
+        else:
+            continue
         if names:
             return names, isos, checked
-    for entry in entries:
-        p = os.path.join(mods_dir, entry)
-        if os.path.isfile(p) and p.lower().endswith(".zip"):
-            checked.append(p)
-            try:
-                with zipfile.ZipFile(p, "r") as zf:
-                    lua_members = [n for n in zf.namelist() if n.lower().endswith("/realisticlivestock.lua") or n.lower()=="realisticlivestock.lua"]
-                    if lua_members:
-                        txt = zf.read(lua_members[0]).decode("utf-8", errors="ignore")
-                        names, isos = _parse_area_codes_from_lua(txt)
-                        if names:
-                            return names, isos, checked
-            except Exception:
-                pass
     return {}, {}, checked
 
 def _load_country_map_json(path: Optional[str]) -> Dict[str, str]:
     if not path: return {}
     try:
-        with open(path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        with open(path, "rb") as fh:
+            raw = fh.read()
+        if raw.startswith(b"\xef\xbb\xbf"): raw = raw[3:]  # Notepad-style UTF-8 BOM; orjson rejects it
+        data = json_loads(raw)
         return {str(k): str(v) for k, v in data.items()}
     except Exception as e:
         print(f"[warn] failed to read country map '{path}': {e}", file=sys.stderr)
@@ -398,6 +588,13 @@ def _country_lookup(code_raw: str, name_map: Dict[str,str], iso_map: Dict[str,st
         name = name_map[code_raw]; iso = iso_map.get(code_raw, iso)
     return (name or f"Unknown ({code_raw})", iso)
 
+def make_country_lookup(name_map: Dict[str,str], iso_map: Dict[str,str], json_map: Dict[str,str]):
+    """_country_lookup bound to one set of maps, memoized per code (a herd has only a few countries)."""
+    @lru_cache(maxsize=None)
+    def lookup(code_raw: str) -> Tuple[str,str]:
+        return _country_lookup(code_raw, name_map, iso_map, json_map)
+    return lookup
+
 # ---------- Core parsing ----------
 def safe_float(x: str) -> Optional[float]:
     try:
@@ -416,6 +613,7 @@ def derive_age_years(months_str: str) -> str:
     m = safe_float(months_str)
     return f"{m/12.0:.2f}" if m is not None else ""
 
+@lru_cache(maxsize=2048)  # herds cluster on a few mating dates/durations
 def derive_due_date(y: str, m: str, d: str, duration_str: str) -> str:
     try:
         if not (y and m and d and duration_str): return ""
@@ -426,6 +624,42 @@ def derive_due_date(y: str, m: str, d: str, duration_str: str) -> str:
     except Exception:
         return ""
 
+def _iter_placeables(placeables_path: str):
+    """Stream top-level <placeable> elements; each subtree is dropped once the caller moves on."""
+    if LXML_OK:
+        # lxml filters by tag in C, so only </placeable> events reach Python
+        for _event, elem in ET.iterparse(placeables_path, events=("end",), tag="placeable", **ITERPARSE_OPTS):
+            parent = elem.getparent()
+            if parent is None or parent.getparent() is not None: continue  # top-level only
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        return
+
+    root = None
+    depth = 0
+    for event, elem in ET.iterparse(placeables_path, events=("start", "end")):
+        if event == "start":
+            if root is None: root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1: continue
+        if elem.tag == "placeable":
+            yield elem
+        root.clear()  # keep only the open path resident, not every processed placeable
+
+# first <husbandryAnimals> and its first <clusters> only, as the original find() chain read them
+ANIMALS_PATH = "husbandryAnimals[1]/clusters[1]/animal"
+
+def _animal_path(farmid_filter: Optional[str]) -> str:
+    """ElementPath (relative to a <placeable>) selecting the <animal> nodes to export, incl. --farmid."""
+    if not farmid_filter: return ANIMALS_PATH
+    fid = str(farmid_filter)
+    q = "'" if '"' in fid else '"'
+    return f"{ANIMALS_PATH}[@farmId={q}{fid}{q}]"
+
 def parse_placeables(placeables_path: str,
                      country_name_map: Dict[str,str],
                      country_iso_map: Dict[str,str],
@@ -433,120 +667,134 @@ def parse_placeables(placeables_path: str,
                      species_filter: Optional[List[str]],
                      farmid_filter: Optional[str],
                      verbose: bool=False) -> Tuple[List[Dict[str,str]], List[Dict[str,str]]]:
+    animals_rows: List[Dict[str,str]] = []
+    fetuses_rows: List[Dict[str,str]] = []
+    animal_path = _animal_path(farmid_filter)
+    country_lookup = make_country_lookup(country_name_map, country_iso_map, json_override)
     try:
-        tree = ET.parse(placeables_path)
+        for plc in _iter_placeables(placeables_path):
+            _parse_placeable(plc, animals_rows, fetuses_rows,
+                             country_lookup, species_filter, animal_path)
     except Exception as e:
         print(f"[error] Failed to parse {placeables_path}: {e}", file=sys.stderr)
         return [], []
-    root = tree.getroot()
-    animals_rows: List[Dict[str,str]] = []
-    fetuses_rows: List[Dict[str,str]] = []
-
-    for plc in root.findall("placeable"):
-        shed_file = plc.get("filename", "")
-        placeable_id = plc.get("id", "") or plc.get("uniqueId", "")
-        current_shed = _basename_or(shed_file, placeable_id or "Husbandry")
-        shed_type = _text(_child(plc, "type")) or _basename_or(shed_file)
-
-        ha = plc.find("husbandryAnimals")
-        if ha is None: continue
-        clusters = ha.find("clusters")
-        if clusters is None: continue
-
-        for animal in clusters.findall("animal"):
-            species = infer_species(plc, shed_file, animal)
-            if species_filter and species and (species not in species_filter):
-                continue
-            if farmid_filter and _get_attr(animal, "farmId") != str(farmid_filter):
-                continue
-
-            row = {k: "" for k in ANIMAL_COLUMNS}
-            row["placeable_id"] = placeable_id
-            row["current_shed"] = current_shed
-            row["shed_type"]    = shed_type
-            row["species"]      = species
-            row["breed"]        = _get_attr(animal, "subType")
-            row["FarmID"]       = _get_attr(animal, "farmId")
-            row["unique_id"]    = _get_attr(animal, "id")
-            row["name"]         = _get_attr(animal, "name")
-            row["sex"]          = _get_attr(animal, "gender")
-            row["age"]          = _get_attr(animal, "age")
-            row["age_days"]     = derive_age_days(row["age"])
-            row["age_years"]    = derive_age_years(row["age"])
-            row["weight"]       = _get_attr(animal, "weight")
-            row["is_parent"]    = _get_attr(animal, "isParent")
-            row["is_pregnant"]  = _get_attr(animal, "isPregnant")
-
-            # health + genetics
-            row["animal_health"] = _get_attr(animal, "health")
-            agen = _genetics(animal)
-            row["animal_gen_metabolism"]   = agen["metabolism"]
-            row["animal_gen_quality"]      = agen["quality"]
-            row["animal_gen_health"]       = agen["health"]
-            row["animal_gen_fertility"]    = agen["fertility"]
-            row["animal_gen_productivity"] = agen["productivity"]
-
-            # birthday & country
-            bday = _child(animal, "birthday")
-            if bday is not None:
-                row["birthday_day"]   = _get_attr(bday, "day")
-                row["birthday_month"] = _get_attr(bday, "month")
-                row["birthday_year"]  = _get_attr(bday, "year")
-                row["country"]        = _get_attr(bday, "country")
-                cname, ciso           = _country_lookup(row["country"], country_name_map, country_iso_map, json_override)
-                row["country_name"]   = cname
-                row["country_iso"]    = ciso
-
-            # pregnancy block (also build fetuses table)
-            preg = _child(animal, "pregnancy")
-            if preg is not None:
-                row["preg_day"]      = _get_attr(preg, "day")
-                row["preg_month"]    = _get_attr(preg, "month")
-                row["preg_year"]     = _get_attr(preg, "year")
-                row["preg_duration"] = _get_attr(preg, "duration")
-                row["preg_due_date"] = derive_due_date(row["preg_year"], row["preg_month"], row["preg_day"], row["preg_duration"])
-
-                pregnancies = _child(preg, "pregnancies")
-                fetus_count = 0
-                if pregnancies is not None:
-                    idx = 0
-                    for fetus in pregnancies.findall("pregnancy"):
-                        idx += 1; fetus_count += 1
-                        fg = _genetics(fetus)
-                        frow = {k: "" for k in FETUS_COLUMNS}
-                        frow["mother_unique_id"] = row["unique_id"]
-                        frow["current_shed"]     = current_shed
-                        frow["shed_type"]        = shed_type
-                        frow["species"]          = species
-                        frow["mother_breed"]     = row["breed"]
-                        frow["fetus_index"]      = str(idx)
-                        frow["sex"]              = _get_attr(fetus, "gender")
-                        frow["breed"]            = _get_attr(fetus, "subType")
-                        frow["health"]           = _get_attr(fetus, "health")
-                        frow["gen_metabolism"]   = fg["metabolism"]
-                        frow["gen_quality"]      = fg["quality"]
-                        frow["gen_health"]       = fg["health"]
-                        frow["gen_fertility"]    = fg["fertility"]
-                        frow["gen_productivity"] = fg["productivity"]
-                        frow["due_date"]         = row["preg_due_date"]
-                        frow["preg_day"]         = row["preg_day"]
-                        frow["preg_month"]       = row["preg_month"]
-                        frow["preg_year"]        = row["preg_year"]
-                        frow["preg_duration"]    = row["preg_duration"]
-                        frow["FarmID"]           = row["FarmID"]
-                        frow["country"]          = row["country"]
-                        frow["country_name"]     = row["country_name"]
-                        frow["country_iso"]      = row["country_iso"]
-                        fetuses_rows.append(frow)
-                row["preg_fetus_count"] = str(fetus_count)
-
-            animals_rows.append(row)
 
     if verbose:
-        print(f"[info] parsed: animals={len(animals_rows)}, fetuses={len(fetuses_rows)}")
+        print(f"[info] parsed {placeables_path}: animals={len(animals_rows)}, fetuses={len(fetuses_rows)}")
 
     return animals_rows, fetuses_rows
 
+def _parse_placeable(plc: ET.Element,
+                     animals_rows: List[Dict[str,str]],
+                     fetuses_rows: List[Dict[str,str]],
+                     country_lookup,
+                     species_filter: Optional[List[str]],
+                     animal_path: str):
+    shed_file = plc.get("filename", "")
+    placeable_id = plc.get("id", "") or plc.get("uniqueId", "")
+    current_shed = _basename_or(shed_file, placeable_id or "Husbandry")
+    shed_type = _text(_child(plc, "type")) or _basename_or(shed_file)
+
+    shed_species = None  # resolved on the first animal; most placeables hold none
+
+    # one compiled path walk instead of find() -> find() -> findall()
+    for animal in plc.iterfind(animal_path):
+        if shed_species is None:
+            shed_species = placeable_species(plc, shed_file)
+        species = infer_species(plc, shed_file, animal, shed_species)
+        if species_filter and species and (species not in species_filter):
+            continue
+
+        # one pass over the animal's children instead of a find() per child element
+        gen = bday = preg = None
+        for ch in animal:
+            tag = ch.tag
+            if tag == "genetics":
+                if gen is None: gen = ch
+            elif tag == "birthday":
+                if bday is None: bday = ch
+            elif tag == "pregnancy":
+                if preg is None: preg = ch
+
+        a = animal.attrib  # plain attribute dict: one lookup per field, no wrapper calls
+        row: Dict[str,str] = {}  # unset columns are read back as "" by the writers
+        row["placeable_id"] = placeable_id
+        row["current_shed"] = current_shed
+        row["shed_type"]    = shed_type
+        row["species"]      = species
+        row["breed"]        = a.get("subType", "")
+        row["FarmID"]       = a.get("farmId", "")
+        row["unique_id"]    = a.get("id", "")
+        row["name"]         = a.get("name", "")
+        row["sex"]          = a.get("gender", "")
+        row["age"]          = a.get("age", "")
+        row["age_days"]     = derive_age_days(row["age"])
+        row["age_years"]    = derive_age_years(row["age"])
+        row["weight"]       = a.get("weight", "")
+        row["is_parent"]    = a.get("isParent", "")
+        row["is_pregnant"]  = a.get("isPregnant", "")
+
+        # health + genetics
+        row["animal_health"] = a.get("health", "")
+        (row["animal_gen_metabolism"], row["animal_gen_quality"], row["animal_gen_health"],
+         row["animal_gen_fertility"], row["animal_gen_productivity"]) = _genetics_attrs(gen)
+
+        # birthday & country
+        if bday is not None:
+            b = bday.attrib
+            row["birthday_day"]   = b.get("day", "")
+            row["birthday_month"] = b.get("month", "")
+            row["birthday_year"]  = b.get("year", "")
+            row["country"]        = b.get("country", "")
+            cname, ciso           = country_lookup(row["country"])
+            row["country_name"]   = cname
+            row["country_iso"]    = ciso
+
+        # pregnancy block (also build fetuses table)
+        if preg is not None:
+            pa = preg.attrib
+            row["preg_day"]      = pa.get("day", "")
+            row["preg_month"]    = pa.get("month", "")
+            row["preg_year"]     = pa.get("year", "")
+            row["preg_duration"] = pa.get("duration", "")
+            row["preg_due_date"] = derive_due_date(row["preg_year"], row["preg_month"], row["preg_day"], row["preg_duration"])
+
+            pregnancies = _child(preg, "pregnancies")
+            fetus_count = 0
+            if pregnancies is not None:
+                # fields every fetus copies from its mother, built once and copied per fetus
+                mother: Dict[str,str] = {
+                    "mother_unique_id": row["unique_id"],
+                    "current_shed":     current_shed,
+                    "shed_type":        shed_type,
+                    "species":          species,
+                    "mother_breed":     row["breed"],
+                    "due_date":         row["preg_due_date"],
+                    "preg_day":         row["preg_day"],
+                    "preg_month":       row["preg_month"],
+                    "preg_year":        row["preg_year"],
+                    "preg_duration":    row["preg_duration"],
+                    "FarmID":           row["FarmID"],
+                    "country":          row.get("country", ""),
+                    "country_name":     row.get("country_name", ""),
+                    "country_iso":      row.get("country_iso", ""),
+                }
+                idx = 0
+                for fetus in pregnancies.findall("pregnancy"):
+                    idx += 1; fetus_count += 1
+                    fa = fetus.attrib
+                    frow = mother.copy()
+                    frow["fetus_index"]      = str(idx)
+                    frow["sex"]              = fa.get("gender", "")
+                    frow["breed"]            = fa.get("subType", "")
+                    frow["health"]           = fa.get("health", "")
+                    (frow["gen_metabolism"], frow["gen_quality"], frow["gen_health"],
+                     frow["gen_fertility"], frow["gen_productivity"]) = _genetics(fetus)
+                    fetuses_rows.append(frow)
+            row["preg_fetus_count"] = str(fetus_count)
+
+        animals_rows.append(row)
+
 # ---------- Summaries ----------
 def _to_float(x: str) -> Optional[float]:
     try:
@@ -555,45 +803,53 @@ def _to_float(x: str) -> Optional[float]:
     except Exception:
         return None
 
+# averaged per summary group, in this order
+_SUMMARY_AVG_FIELDS = (
+    "age", "animal_health",
+    "animal_gen_metabolism", "animal_gen_quality", "animal_gen_health",
+    "animal_gen_fertility", "animal_gen_productivity",
+)
+
 def summarize(animals_rows: List[Dict[str,str]]) -> List[Dict[str,str]]:
-    # group by (shed, shed_type, species, breed)
-    groups: Dict[Tuple[str,str,str,str], List[Dict[str,str]]] = {}
+    # group by (shed, shed_type, species, breed) in a single pass over the animals;
+    # per group: [count, pregnant, fetuses, sums per _SUMMARY_AVG_FIELDS, counts per field]
+    groups: Dict[Tuple[str,str,str,str], list] = {}
+    n_fields = len(_SUMMARY_AVG_FIELDS)
     for r in animals_rows:
         key = (r["current_shed"], r["shed_type"], r["species"], r["breed"])
-        groups.setdefault(key, []).append(r)
+        acc = groups.get(key)
+        if acc is None:
+            acc = groups[key] = [0, 0, 0, [0.0] * n_fields, [0] * n_fields]
+        acc[0] += 1
+        if (r.get("is_pregnant") or "").lower() in _TRUE:
+            acc[1] += 1
+        acc[2] += int(r.get("preg_fetus_count") or "0")
+        sums, counts = acc[3], acc[4]
+        for k, field in enumerate(_SUMMARY_AVG_FIELDS):
+            v = _to_float(r.get(field))
+            if v is not None:
+                sums[k] += v; counts[k] += 1
 
     summary_rows: List[Dict[str,str]] = []
-    for (shed, shed_type, species, breed), items in groups.items():
-        count = len(items)
-        pregnant = sum(1 for it in items if (it.get("is_pregnant") or "").lower() in ("true","1","yes","on"))
-        # averages
-        ages = [_to_float(it.get("age")) for it in items if _to_float(it.get("age")) is not None]
-        healths = [_to_float(it.get("animal_health")) for it in items if _to_float(it.get("animal_health")) is not None]
-        gm = [_to_float(it.get("animal_gen_metabolism")) for it in items if _to_float(it.get("animal_gen_metabolism")) is not None]
-        gq = [_to_float(it.get("animal_gen_quality")) for it in items if _to_float(it.get("animal_gen_quality")) is not None]
-        gh = [_to_float(it.get("animal_gen_health")) for it in items if _to_float(it.get("animal_gen_health")) is not None]
-        gf = [_to_float(it.get("animal_gen_fertility")) for it in items if _to_float(it.get("animal_gen_fertility")) is not None]
-        gp = [_to_float(it.get("animal_gen_productivity")) for it in items if _to_float(it.get("animal_gen_productivity")) is not None]
-        total_fetuses = sum(int(it.get("preg_fetus_count") or "0") for it in items)
-
-        def avg(arr):
-            return sum(arr)/len(arr) if arr else None
-
-        row = {k: "" for k in SUMMARY_COLUMNS}
+    for (shed, shed_type, species, breed), (count, pregnant, total_fetuses, sums, counts) in groups.items():
+        avgs = [sums[k]/counts[k] if counts[k] else None for k in range(n_fields)]
+        avg_age = avgs[0]
+
+        row = dict.fromkeys(SUMMARY_COLUMNS, "")
         row["current_shed"] = shed
         row["shed_type"]    = shed_type
         row["species"]      = species
         row["breed"]        = breed
         row["animals_count"] = str(count)
         row["pregnant_count"] = str(pregnant)
-        row["avg_age_months"] = fmt_num(avg(ages))
-        row["avg_age_years"]  = fmt_num((avg(ages)/12.0) if ages else None)
-        row["avg_health"]     = fmt_num(avg(healths))
-        row["avg_gen_metabolism"]   = fmt_num(avg(gm))
-        row["avg_gen_quality"]      = fmt_num(avg(gq))
-        row["avg_gen_health"]       = fmt_num(avg(gh))
-        row["avg_gen_fertility"]    = fmt_num(avg(gf))
-        row["avg_gen_productivity"] = fmt_num(avg(gp))
+        row["avg_age_months"] = fmt_num(avg_age)
+        row["avg_age_years"]  = fmt_num((avg_age/12.0) if avg_age is not None else None)
+        row["avg_health"]     = fmt_num(avgs[1])
+        row["avg_gen_metabolism"]   = fmt_num(avgs[2])
+        row["avg_gen_quality"]      = fmt_num(avgs[3])
+        row["avg_gen_health"]       = fmt_num(avgs[4])
+        row["avg_gen_fertility"]    = fmt_num(avgs[5])
+        row["avg_gen_productivity"] = fmt_num(avgs[6])
         row["total_fetuses"]        = str(total_fetuses)
 
         summary_rows.append(row)
@@ -602,6 +858,8 @@ def summarize(animals_rows: List[Dict[str,str]]) -> List[Dict[str,str]]:
     return summary_rows
 
 # ---------- IO helpers ----------
+CSV_BUFFER_SIZE = 1 << 20
+
 def ensure_dir_for(path: str):
     d = os.path.dirname(path)
     if d and not os.path.isdir(d):
@@ -609,27 +867,65 @@ def ensure_dir_for(path: str):
 
 def write_csv(path: str, cols: List[str], rows: List[Dict[str,str]]):
     ensure_dir_for(path)
-    with open(path, "w", newline="", encoding="utf-8") as fh:
-        w = csv.DictWriter(fh, fieldnames=cols)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: r.get(k, "") for k in cols})
-
-def _format_date_columns(ws, columns: List[str], date_cols: set):
-    """Apply Excel date number_format to cells that actually contain dates."""
-    if not date_cols: return
-    for col_name in date_cols:
-        if col_name not in columns: continue
-        col_idx = columns.index(col_name) + 1  # 1-based
-        for row in range(2, ws.max_row + 1):  # skip header
-            cell = ws.cell(row=row, column=col_idx)
-            # only format true date objects (text stays as text)
-            if isinstance(cell.value, date):
+    # 1 MiB buffer: far fewer write() syscalls than the 8 KiB default on large herds
+    with open(path, "w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as fh:
+        w = csv.writer(fh)
+        w.writerow(cols)
+        # rows are produced lazily and consumed by writerows' C loop; missing columns -> ""
+        w.writerows([r.get(c, "") for c in cols] for r in rows)
+
+def _write_only_sheet(wb, title: str, columns: List[str], rows: List[Dict[str,str]],
+                      int_cols: set, float_cols: set, date_cols: set):
+    """Stream one sheet into a write-only workbook; real dates get an Excel date format."""
+    ws = wb.create_sheet(title)
+    ws.freeze_panes = "A2"  # sheet views are written before the first row, so set this up front
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{len(rows) + 1}"
+    ws.append(columns)
+    schema = _build_schema(columns, int_cols, float_cols, date_cols)
+    date_idx = [i for i, col in enumerate(columns) if col in date_cols]
+    for r in rows:
+        values = _cast_row(r, schema)
+        for i in date_idx:
+            # only true date objects get a number format (pre-1900 text stays text)
+            if isinstance(values[i], date):
+                cell = WriteOnlyCell(ws, value=values[i])
                 cell.number_format = "yyyy-mm-dd"
+                values[i] = cell
+        ws.append(values)
+
+def _xlsxwriter_sheet(wb, date_fmt, title: str, columns: List[str], rows: List[Dict[str,str]],
+                      int_cols: set, float_cols: set, date_cols: set):
+    """Write one sheet with xlsxwriter, using explicit cell types (no formula/URL guessing)."""
+    ws = wb.add_worksheet(title)
+    ws.freeze_panes(1, 0)
+    ws.autofilter(0, 0, len(rows), len(columns) - 1)
+    ws.write_row(0, 0, columns)
+    schema = _build_schema(columns, int_cols, float_cols, date_cols)
+    for r_idx, r in enumerate(rows, start=1):
+        for c_idx, val in enumerate(_cast_row(r, schema)):
+            if val is None:
+                continue
+            if isinstance(val, date):
+                ws.write_datetime(r_idx, c_idx, val, date_fmt)
+            elif isinstance(val, str):
+                ws.write_string(r_idx, c_idx, val)
+            else:
+                ws.write_number(r_idx, c_idx, val)
 
 def write_xlsx(path: str, animals: List[Dict[str,str]], fetuses: List[Dict[str,str]], summary: List[Dict[str,str]]):
+    if XLSXWRITER_OK:
+        ensure_dir_for(path)
+        # constant_memory flushes each row as soon as the next one starts
+        wb = xlsxwriter.Workbook(path, {"constant_memory": True})
+        date_fmt = wb.add_format({"num_format": "yyyy-mm-dd"})
+        _xlsxwriter_sheet(wb, date_fmt, "Animals", ANIMAL_COLUMNS, animals, ANIMAL_INT_COLS, ANIMAL_FLOAT_COLS, ANIMAL_DATE_COLS)
+        _xlsxwriter_sheet(wb, date_fmt, "Fetuses", FETUS_COLUMNS, fetuses, FETUS_INT_COLS, FETUS_FLOAT_COLS, FETUS_DATE_COLS)
+        _xlsxwriter_sheet(wb, date_fmt, "Summary", SUMMARY_COLUMNS, summary, SUMMARY_INT_COLS, SUMMARY_FLOAT_COLS, SUMMARY_DATE_COLS)
+        wb.close()
+        return
+
     if not OPENPYXL_OK:
-        print("[warn] openpyxl not installed; writing CSVs instead.", file=sys.stderr)
+        print("[warn] neither xlsxwriter nor openpyxl installed; writing CSVs instead.", file=sys.stderr)
         base = os.path.splitext(path)[0]
         write_csv(base + "_animals.csv", ANIMAL_COLUMNS, animals)
         write_csv(base + "_fetuses.csv", FETUS_COLUMNS, fetuses)
@@ -637,44 +933,23 @@ def write_xlsx(path: str, animals: List[Dict[str,str]], fetuses: List[Dict[str,s
         return
 
     ensure_dir_for(path)
-    wb = Workbook()
-
-    # Animals
-    ws = wb.active; ws.title = "Animals"
-    ws.append(ANIMAL_COLUMNS)
-    for r in animals:
-        ws.append(_cast_for_sheet(r, ANIMAL_COLUMNS, ANIMAL_INT_COLS, ANIMAL_FLOAT_COLS, ANIMAL_DATE_COLS))
-    ws.auto_filter.ref = f"A1:{get_column_letter(len(ANIMAL_COLUMNS))}{ws.max_row}"
-    ws.freeze_panes = "A2"
-    _format_date_columns(ws, ANIMAL_COLUMNS, ANIMAL_DATE_COLS)
-
-    # Fetuses
-    ws2 = wb.create_sheet("Fetuses")
-    ws2.append(FETUS_COLUMNS)
-    for r in fetuses:
-        ws2.append(_cast_for_sheet(r, FETUS_COLUMNS, FETUS_INT_COLS, FETUS_FLOAT_COLS, FETUS_DATE_COLS))
-    ws2.auto_filter.ref = f"A1:{get_column_letter(len(FETUS_COLUMNS))}{ws2.max_row}"
-    ws2.freeze_panes = "A2"
-    _format_date_columns(ws2, FETUS_COLUMNS, FETUS_DATE_COLS)
-
-    # Summary
-    ws3 = wb.create_sheet("Summary")
-    ws3.append(SUMMARY_COLUMNS)
-    for r in summary:
-        ws3.append(_cast_for_sheet(r, SUMMARY_COLUMNS, SUMMARY_INT_COLS, SUMMARY_FLOAT_COLS, SUMMARY_DATE_COLS))
-    ws3.auto_filter.ref = f"A1:{get_column_letter(len(SUMMARY_COLUMNS))}{ws3.max_row}"
-    ws3.freeze_panes = "A2"
-
+    # write-only mode streams rows to disk instead of keeping every cell object alive
+    wb = Workbook(write_only=True)
+    _write_only_sheet(wb, "Animals", ANIMAL_COLUMNS, animals, ANIMAL_INT_COLS, ANIMAL_FLOAT_COLS, ANIMAL_DATE_COLS)
+    _write_only_sheet(wb, "Fetuses", FETUS_COLUMNS, fetuses, FETUS_INT_COLS, FETUS_FLOAT_COLS, FETUS_DATE_COLS)
+    _write_only_sheet(wb, "Summary", SUMMARY_COLUMNS, summary, SUMMARY_INT_COLS, SUMMARY_FLOAT_COLS, SUMMARY_DATE_COLS)
     wb.save(path)
 
 # ---------- Save iteration ----------
-def list_saves(fs_root: str) -> List[str]:
+def list_saves(fs_root: str) -> List[Tuple[str, str]]:
+    """(path, folder name) of every savegame* folder holding a placeables.xml, sorted by name."""
     out = []
-    for name in sorted(os.listdir(fs_root)):
-        if not name.lower().startswith("savegame"): continue
-        p = os.path.join(fs_root, name)
-        if os.path.isdir(p) and os.path.isfile(os.path.join(p, "placeables.xml")):
-            out.append(p)
+    with os.scandir(fs_root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for e in entries:
+        if not e.name.lower().startswith("savegame"): continue
+        if e.is_dir() and os.path.isfile(os.path.join(e.path, "placeables.xml")):
+            out.append((e.path, e.name))
     return out
 
 # ---------- CLI & main ----------
@@ -683,21 +958,41 @@ def resolve_save_dir(save_arg: str) -> str:
     if os.path.isdir(cand): return cand
     return os.path.join(os.getcwd(), save_arg)
 
-def run_for_save(save_dir: str,
-                 out_csv: Optional[str],
-                 xlsx_path: Optional[str],
-                 summary_out_path: Optional[str],
-                 country_json_path: Optional[str],
-                 rl_path: Optional[str],
-                 species_filter_list: Optional[List[str]],
-                 farmid_filter: Optional[str],
-                 verbose: bool):
-    placeables_path = os.path.join(save_dir, "placeables.xml")
-    if not os.path.isfile(placeables_path):
-        print(f"[error] placeables.xml not found at: {placeables_path}", file=sys.stderr)
-        return
-
-    # Country maps
+XLSX_SUFFIX = "_livestock.xlsx"  # default workbook name is <save> + XLSX_SUFFIX
+
+def _save_name(save_dir: str) -> str:
+    """Folder name of a save path, tolerating a trailing slash or backslash."""
+    return os.path.basename(save_dir.rstrip("/\\"))
+
+def _classify_xlsx(xlsx_arg: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """How --all-saves treats --xlsx, decided once for every save: ("auto", None) for a bare --xlsx
+    (<save>/<save>_livestock.xlsx), ("path", folder) for a folder, else (None, None) -> CSVs.
+    A single .xlsx file cannot hold several saves, so it falls back to CSVs as well."""
+    if xlsx_arg is None: return None, None
+    if xlsx_arg == "": return "auto", None
+    # string tests first: only a name ending in .xlsx needs the isdir() stat
+    if xlsx_arg.endswith(os.sep) or not xlsx_arg.lower().endswith(".xlsx") or os.path.isdir(xlsx_arg):
+        return "path", xlsx_arg
+    return None, None
+
+def _output_paths(save_dir: str, out_csv: Optional[str], xlsx_path: Optional[str],
+                  summary_out_path: Optional[str]) -> List[str]:
+    """Files run_for_save writes for one save: [workbook] or [animals, fetuses, summary] CSVs."""
+    save_name = _save_name(save_dir)
+    if xlsx_path:
+        xlsx = xlsx_path
+        if os.path.isdir(xlsx) or xlsx.endswith(os.sep):
+            xlsx = os.path.join(xlsx, save_name + XLSX_SUFFIX)
+        return [xlsx]
+    animals_out = out_csv or os.path.join(save_dir, "livestock.csv")
+    fetuses_out = os.path.splitext(animals_out)[0] + "_fetuses.csv"
+    summary_csv = summary_out_path or os.path.join(save_dir, "livestock_summary.csv")
+    return [animals_out, fetuses_out, summary_csv]
+
+def load_country_maps(country_json_path: Optional[str],
+                      rl_path: Optional[str],
+                      verbose: bool) -> Tuple[Dict[str,str], Dict[str,str], Dict[str,str]]:
+    """Resolve (name_map, iso_map, json_override) once per run; the RL mod is the same for every save."""
     json_override = _load_country_map_json(country_json_path)
     name_map: Dict[str,str] = {}
     iso_map: Dict[str,str]  = {}
@@ -716,25 +1011,46 @@ def run_for_save(save_dir: str,
                     print("[info] paths checked:")
                     for p in checked:
                         print("  -", p)
+    return name_map, iso_map, json_override
+
+class RunConfig(NamedTuple):
+    """Settings shared by every save of one run; built once in main() and passed to each export."""
+    out_csv: Optional[str]
+    summary_out_path: Optional[str]
+    country_maps: Tuple[Dict[str,str], Dict[str,str], Dict[str,str]]
+    species_filter_list: Optional[List[str]]
+    farmid_filter: Optional[str]
+    verbose: bool
+
+def _placeables_path(save_dir: str) -> Optional[str]:
+    """<save>/placeables.xml, or None (with an error message) when the save has none."""
+    placeables_path = os.path.join(save_dir, "placeables.xml")
+    if not os.path.isfile(placeables_path):
+        print(f"[error] placeables.xml not found at: {placeables_path}", file=sys.stderr)
+        return None
+    return placeables_path
 
+def run_for_save(save_dir: str, xlsx_path: Optional[str], cfg: RunConfig):
+    placeables_path = _placeables_path(save_dir)
+    if placeables_path is None:
+        return
+
+    name_map, iso_map, json_override = cfg.country_maps
     animals, fetuses = parse_placeables(
         placeables_path,
         name_map, iso_map, json_override,
-        species_filter_list, farmid_filter, verbose=verbose
+        cfg.species_filter_list, cfg.farmid_filter, verbose=cfg.verbose
     )
     summary = summarize(animals)
 
-    save_name = os.path.basename(save_dir.rstrip("/\\"))
+    save_name = _save_name(save_dir)
+    outputs = _output_paths(save_dir, cfg.out_csv, xlsx_path, cfg.summary_out_path)
     if xlsx_path:
-        xlsx = xlsx_path
-        if os.path.isdir(xlsx) or xlsx.endswith(os.sep):
-            xlsx = os.path.join(xlsx, f"{save_name}_livestock.xlsx")
+        xlsx = outputs[0]
         write_xlsx(xlsx, animals, fetuses, summary)
         print(f"[ok] {save_name}: wrote {xlsx}")
     else:
-        animals_out = out_csv or os.path.join(save_dir, "livestock.csv")
-        fetuses_out = os.path.splitext(animals_out)[0] + "_fetuses.csv"
-        summary_csv = summary_out_path or os.path.join(save_dir, "livestock_summary.csv")
+        animals_out, fetuses_out, summary_csv = outputs
         write_csv(animals_out, ANIMAL_COLUMNS, animals)
         write_csv(fetuses_out, FETUS_COLUMNS, fetuses)
         write_csv(summary_csv, SUMMARY_COLUMNS, summary)
@@ -774,48 +1090,43 @@ def main():
         if not saves:
             print("[info] no savegame* folders with placeables.xml found here.")
             return
-        # If --xlsx has "", build per-save defaults; if it's a non-empty path, treat as directory unless it ends with .xlsx
-        xlsx_is_dir = None
-        xlsx_root = None
-        if args.xlsx is not None:
-            if args.xlsx == "":
-                xlsx_is_dir = False
-            else:
-                if args.xlsx.endswith(os.sep) or (os.path.isdir(args.xlsx) or not args.xlsx.lower().endswith(".xlsx")):
-                    xlsx_is_dir = True
-                    xlsx_root = args.xlsx
-        for sdir in saves:
-            if args.xlsx is None:
-                xlsx_path = None
-            else:
-                if xlsx_is_dir is True:
-                    xlsx_path = xlsx_root
-                elif xlsx_is_dir is False:
-                    save_name = os.path.basename(sdir.rstrip("/\\"))
-                    xlsx_path = os.path.join(sdir, f"{save_name}_livestock.xlsx")
-                else:
-                    xlsx_path = None
-            run_for_save(
-                sdir,
-                args.out, xlsx_path, args.summary_out,
-                args.country_map, args.rl,
-                species_filter_list, args.farmid, args.verbose
-            )
+        xlsx_mode, xlsx_root = _classify_xlsx(args.xlsx)
+        if xlsx_mode == "path" and not os.path.exists(xlsx_root):
+            # create the report folder once, so every save sees a directory and writes <save>_livestock.xlsx into it
+            os.makedirs(xlsx_root, exist_ok=True)
     else:
         save_dir = resolve_save_dir(args.save)
-        if args.xlsx is None:
-            xlsx_path = None
-        elif args.xlsx == "":
-            save_name = os.path.basename(save_dir.rstrip("/\\"))
-            xlsx_path = os.path.join(save_dir, f"{save_name}_livestock.xlsx")
+        # fail on a mistyped --save before scanning the mods folder for country maps
+        if _placeables_path(save_dir) is None:
+            return
+        saves = [(save_dir, _save_name(save_dir))]
+        # a single save may also name the workbook file itself; _output_paths tells file from folder
+        xlsx_mode, xlsx_root = ("path", args.xlsx) if args.xlsx else _classify_xlsx(args.xlsx)
+
+    cfg = RunConfig(args.out, args.summary_out,
+                    load_country_maps(args.country_map, args.rl, args.verbose),
+                    species_filter_list, args.farmid, args.verbose)
+    jobs = []
+    for sdir, save_name in saves:
+        if xlsx_mode == "path":
+            xlsx_path = xlsx_root
+        elif xlsx_mode == "auto":
+            xlsx_path = os.path.join(sdir, save_name + XLSX_SUFFIX)
         else:
-            xlsx_path = args.xlsx
-        run_for_save(
-            save_dir,
-            args.out, xlsx_path, args.summary_out,
-            args.country_map, args.rl,
-            species_filter_list, args.farmid, args.verbose
-        )
+            xlsx_path = None
+        jobs.append((sdir, xlsx_path))
+    # Saves are independent, so export them in parallel -- unless they would write the
+    # same files (e.g. a fixed --out), in which case keep the serial last-one-wins order.
+    outputs = [p for sdir, xlsx_path in jobs
+               for p in _output_paths(sdir, cfg.out_csv, xlsx_path, cfg.summary_out_path)]
+    if len(jobs) == 1 or len(set(outputs)) != len(outputs):
+        for sdir, xlsx_path in jobs:
+            run_for_save(sdir, xlsx_path, cfg)
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as ex:
+            # as_completed picks up a failed save as soon as its worker ends, not after earlier saves
+            for fut in as_completed([ex.submit(run_for_save, sdir, xlsx_path, cfg) for sdir, xlsx_path in jobs]):
+                fut.result()
 
 if __name__ == "__main__":
     main()